@@ -24,6 +24,7 @@ if [[ "$MODE" != "index" && "$MODE" != "server" && "$MODE" != "test" ]]; then
     echo "Modes:"
     echo "  index   Build the Tantivy index from parquet files"
     echo "          Options: --parquet-dir <dir> --index-dir <dir> --dataset <finewiki|fineweb-edu>"
+    echo "                   [--heap-size-gb <n>] [--num-threads <n>] [--force]"
     echo ""
     echo "  server  Run the MCP server"
     echo "          Options: --index-dir <dir> --dataset <finewiki|fineweb-edu>"
@@ -46,10 +47,19 @@ run_index() {
     local parquet_dir="$PARQUET_DIR"
     local index_dir="$INDEX_DIR"
     local dataset="$DATASET"
+    local extra_args=()
 
     # Parse remaining arguments
     while [[ $# -gt 0 ]]; do
         case "$1" in
+            --force)
+                extra_args+=("--force")
+                shift
+                ;;
+            --heap-size-gb|--num-threads)
+                extra_args+=("$1" "$2")
+                shift 2
+                ;;
             --parquet-dir)
                 parquet_dir="$2"
                 shift 2
@@ -106,7 +116,8 @@ run_index() {
         /app/.venv/bin/python -u src/finewiki_mcp/indexer.py \
         --parquet-dir "/parquet_data/$(basename "$resolved_parquet")" \
         --index-dir "/host_project/$(basename "$index_dir")" \
-        --dataset "$dataset"
+        --dataset "$dataset" \
+        "${extra_args[@]}"
 }
 
 # Function to run in server mode
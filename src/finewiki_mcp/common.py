@@ -1,5 +1,11 @@
 """Common utilities shared between indexer and server."""
 
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
 import tantivy
 
 
@@ -15,18 +21,30 @@ def get_schema(dataset: str = "finewiki") -> tantivy.Schema:
 
     Schema differences:
         - finewiki: id (int), title, content, url
-        - fineweb-edu: id (str), text, dump, url, date, file_path, language
+        - fineweb-edu: id (str, exact-match), text, dump, url, date, file_path, language
     """
     schema_builder = tantivy.SchemaBuilder()
 
     if dataset == "fineweb-edu":
-        # FineWeb-Edu schema
-        schema_builder.add_text_field("id", stored=True, index_option="position")
+        # FineWeb-Edu schema. The id is an opaque key only ever matched
+        # exactly, so it is stored as a single untokenized term without
+        # frequencies or positions.
+        schema_builder.add_text_field(
+            "id", stored=True, tokenizer_name="raw", index_option="basic"
+        )
         schema_builder.add_text_field("text", stored=True, index_option="position")
-        schema_builder.add_text_field("dump", stored=True)
+        # dump/date/language are short labels, never phrase-queried: index
+        # them as single raw terms instead of tokens with positions.
+        schema_builder.add_text_field(
+            "dump", stored=True, tokenizer_name="raw", index_option="basic"
+        )
         schema_builder.add_text_field("url", stored=True, index_option="position")
-        schema_builder.add_text_field("date", stored=True)
-        schema_builder.add_text_field("language", stored=True)
+        schema_builder.add_text_field(
+            "date", stored=True, tokenizer_name="raw", index_option="basic"
+        )
+        schema_builder.add_text_field(
+            "language", stored=True, tokenizer_name="raw", index_option="basic"
+        )
     else:
         # FineWiki schema (default)
         schema_builder.add_integer_field("id", stored=True, indexed=True)
@@ -62,3 +80,51 @@ def get_dataset_info(dataset: str = "finewiki") -> dict:
             "primary_text_field": "content",
             "id_type": "integer",
         }
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries expire after a fixed time-to-live.
+
+    A minimal stand-in for ``cachetools.TTLCache`` so the server does not
+    need another dependency. Safe to share between threads.
+
+    Args:
+        maxsize: Maximum number of entries; the least recently used entry
+                 is evicted when full.
+        ttl: Seconds an entry stays valid after it was stored.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for ``key``, or ``default`` if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting the oldest entry if full."""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -1,10 +1,19 @@
 """Index generator for FineWiki and FineWeb-Edu datasets using Tantivy."""
 
+import fcntl
+import hashlib
 import json
+import os
 import shutil
+import sys
+import threading
 import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
 
+import pyarrow as pa
 import pyarrow.parquet as pq
 import tantivy
 
@@ -15,22 +24,108 @@ except ImportError:
 
 
 METADATA_FILE = "indexed_files.json"
+# Bumped whenever get_schema changes so existing indexes are rebuilt.
+METADATA_VERSION = 3
+LOCK_FILE = ".build.lock"
+# Seconds the CLI waits before a rebuild when run from a terminal.
+REBUILD_COUNTDOWN = 10
+BATCH_SIZE = 8192
+# Match the parquet batch size so each decoded batch is handed to the writer
+# in a single locked flush.
+DOC_BUFFER_SIZE = BATCH_SIZE
+WRITER_HEAP_SIZE = 4 * 1024**3
+# Past a handful of indexing threads the heap is split into arenas so small
+# that segments get tiny and merging dominates; parquet decoding still uses
+# every core through the file worker pool.
+WRITER_NUM_THREADS = max(1, min(8, os.cpu_count() or 1))
+# Bounds tantivy enforces on the memory arena of each indexing thread.
+WRITER_MIN_HEAP_PER_THREAD = 15_000_000
+WRITER_MAX_HEAP_PER_THREAD = 4_293_967_294
+
+# Parquet columns read for each dataset; every other column is skipped.
+PARQUET_COLUMNS = {
+    "finewiki": ("page_id", "title", "text", "url"),
+    "fineweb-edu": ("id", "text", "dump", "url", "date", "language"),
+}
 
 
 def load_metadata(index_dir: Path) -> dict:
-    """Load indexed files metadata from index directory."""
+    """Load indexed files metadata from index directory.
+
+    An unreadable (e.g. truncated) metadata file is treated as missing, so
+    the next build starts from scratch instead of failing.
+    """
     metadata_path = index_dir / METADATA_FILE
     if metadata_path.exists():
         with open(metadata_path, "r") as f:
-            return json.load(f)
-    return {"indexed_files": {}, "version": 1}
+            try:
+                return json.load(f)
+            except json.JSONDecodeError:
+                print(f"Ignoring unreadable {metadata_path}, a full rebuild is required.")
+                return {}
+    return {"indexed_files": {}, "version": METADATA_VERSION}
 
 
 def save_metadata(index_dir: Path, metadata: dict) -> None:
-    """Save indexed files metadata to index directory."""
+    """Save indexed files metadata to index directory.
+
+    The file is written to a sibling temporary file and renamed into place,
+    so an interrupted write never leaves a truncated metadata file behind.
+    """
     metadata_path = index_dir / METADATA_FILE
-    with open(metadata_path, "w") as f:
+    tmp_path = metadata_path.with_name(metadata_path.name + ".tmp")
+    with open(tmp_path, "w") as f:
         json.dump(metadata, f, indent=2)
+    os.replace(tmp_path, metadata_path)
+
+
+@contextmanager
+def acquire_lock(lock_path: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock on ``lock_path`` for the duration.
+
+    Uses ``flock`` so acquisition is a single atomic syscall and the kernel
+    releases the lock if the process dies; no stale-lock cleanup is needed.
+
+    Args:
+        lock_path: Lock file to create (if missing) and lock.
+
+    Raises:
+        RuntimeError: If another process already holds the lock.
+    """
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            raise RuntimeError(
+                f"Another build is already running (lock held on {lock_path})"
+            ) from None
+        try:
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+def clamp_writer_heap(heap_size: int, num_threads: int) -> int:
+    """Clamp an overall writer heap size to what tantivy accepts.
+
+    tantivy splits the heap evenly between indexing threads and rejects a
+    per-thread arena below 15 MB or at/above 4 GiB.
+
+    Args:
+        heap_size: Requested overall heap size in bytes.
+        num_threads: Number of indexing threads (at least 1).
+
+    Returns:
+        Overall heap size in bytes within tantivy's per-thread bounds.
+    """
+    per_thread = heap_size // num_threads
+    per_thread = min(
+        max(per_thread, WRITER_MIN_HEAP_PER_THREAD), WRITER_MAX_HEAP_PER_THREAD
+    )
+    return per_thread * num_threads
 
 
 def create_index(index_dir: Path, dataset: str = "finewiki") -> tantivy.Index:
@@ -48,6 +143,82 @@ def create_index(index_dir: Path, dataset: str = "finewiki") -> tantivy.Index:
     return tantivy.Index(schema, path=str(index_dir))
 
 
+def index_schema_matches(index_path: Path, dataset: str) -> bool:
+    """Return True if the index at ``index_path`` uses the current schema.
+
+    Guards the up-to-date check against schema changes in
+    :func:`get_schema`: an index built with an older schema is rebuilt even
+    though its parquet files are unchanged.
+
+    Args:
+        index_path: Directory of an existing tantivy index.
+        dataset: Dataset name - either 'finewiki' or 'fineweb-edu'.
+
+    Returns:
+        True if the index opens and its schema equals ``get_schema(dataset)``.
+    """
+    try:
+        return tantivy.Index.open(str(index_path)).schema == get_schema(dataset)
+    except ValueError:
+        return False
+
+
+def compute_file_hash(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file.
+
+    Uses ``hashlib.file_digest`` so the read loop runs in C and releases the
+    GIL, which lets several files be hashed concurrently from threads.
+
+    Args:
+        path: File to hash.
+
+    Returns:
+        Hex-encoded SHA-256 digest.
+    """
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _stat_matches(st: os.stat_result, previous: dict | None) -> bool:
+    """Return True if a previous metadata entry still describes a file.
+
+    Args:
+        st: Current ``stat`` result of the file.
+        previous: Metadata entry recorded for the file by a previous build.
+
+    Returns:
+        True if the entry has a hash and its mtime and size match ``st``.
+    """
+    return (
+        bool(previous)
+        and "hash" in previous
+        and previous.get("mtime_ns") == st.st_mtime_ns
+        and previous.get("size") == st.st_size
+    )
+
+
+def file_fingerprint(path: Path, previous: dict | None = None) -> dict:
+    """Return the hash, mtime and size recorded for a parquet file.
+
+    When ``previous`` (the entry from an earlier build's metadata) has the
+    same ``mtime_ns`` and ``size`` as the file on disk, its hash is reused
+    and the file is not read at all. Otherwise the file is hashed.
+
+    Args:
+        path: Parquet file to fingerprint.
+        previous: Metadata entry recorded for this file by a previous build.
+
+    Returns:
+        Dictionary with ``hash``, ``mtime_ns`` and ``size`` keys.
+    """
+    st = path.stat()
+    if _stat_matches(st, previous):
+        file_hash = previous["hash"]
+    else:
+        file_hash = compute_file_hash(path)
+    return {"hash": file_hash, "mtime_ns": st.st_mtime_ns, "size": st.st_size}
+
+
 def load_parquet_files(parquet_dir: Path) -> list[Path]:
     """Load all parquet files from a directory."""
     if not parquet_dir.exists():
@@ -55,73 +226,240 @@ def load_parquet_files(parquet_dir: Path) -> list[Path]:
     return sorted(parquet_dir.glob("*.parquet"))
 
 
+def _batch_columns(
+    batch: pa.RecordBatch,
+    names: tuple[str, ...],
+    casts: dict[str, pa.DataType] | None = None,
+) -> list[list]:
+    """Decode the named columns of a record batch into Python lists.
+
+    Columns missing from the batch are returned as lists of empty strings,
+    mirroring the previous ``row.get(name, "")`` behaviour.
+
+    Args:
+        batch: Arrow record batch read from a parquet file.
+        names: Column names to extract, in order.
+        casts: Optional Arrow types to cast columns to before decoding, so
+            type conversion happens once per batch in Arrow, not per value.
+
+    Returns:
+        One Python list per requested column, each ``batch.num_rows`` long.
+    """
+    casts = casts or {}
+    schema_names = batch.schema.names
+    columns = []
+    for name in names:
+        if name not in schema_names:
+            columns.append([""] * batch.num_rows)
+            continue
+        column = batch.column(name)
+        if name in casts:
+            column = column.cast(casts[name])
+        columns.append(column.to_pylist())
+    return columns
+
+
+def _add_documents(writer: tantivy.IndexWriter, docs: list[tantivy.Document]) -> None:
+    """Submit a buffer of documents to the index writer.
+
+    tantivy-py has no bulk ``add_documents`` binding, so documents are built
+    up front and handed over in one tight loop with the bound method hoisted.
+
+    Args:
+        writer: Open tantivy IndexWriter.
+        docs: Documents to add, in order.
+    """
+    add_document = writer.add_document
+    for doc in docs:
+        add_document(doc)
+
+
 def index_parquet_file(
-    index: tantivy.Index, parquet_file: Path, dataset: str = "finewiki"
+    writer: tantivy.IndexWriter,
+    parquet_file: Path,
+    dataset: str = "finewiki",
+    writer_lock: threading.Lock | None = None,
 ) -> int:
     """Index a single parquet file and return the number of documents indexed.
 
+    Documents are added to the shared writer but not committed; the caller
+    owns the writer and commits once all files have been processed.
+
     Args:
-        index: Tantivy Index instance to add documents to.
+        writer: Tantivy IndexWriter to add documents to.
         parquet_file: Path to the parquet file to index.
         dataset: Dataset name - either 'finewiki' or 'fineweb-edu'.
+        writer_lock: Lock serializing access to the writer when several
+            files are indexed concurrently. The tantivy-py writer cannot be
+            borrowed from two threads at once.
 
     Returns:
         Number of documents indexed from this file.
     """
-    reader = pq.ParquetFile(parquet_file)
+    # Memory-map local shards so column chunks are paged in by the kernel
+    # rather than copied through buffered reads, and pre-buffer so the
+    # projected column chunks of a row group are fetched in coalesced reads.
+    reader = pq.ParquetFile(parquet_file, memory_map=True, pre_buffer=True)
     num_rows = reader.metadata.num_rows
 
-    writer = index.writer()
-
-    table = reader.read().to_pandas()
-
-    if dataset == "fineweb-edu":
-        # FineWeb-Edu schema: text, id, dump, url, date, file_path, language
-        for _, row in table.iterrows():
-            doc = tantivy.Document()
-            doc.add_text("id", str(row.get("id", "")))
-            doc.add_text("text", str(row.get("text", "")))
-            doc.add_text("dump", str(row.get("dump", "")))
-            doc.add_text("url", str(row.get("url", "")))
-            doc.add_text("date", str(row.get("date", "")))
-            doc.add_text("language", str(row.get("language", "")))
-            writer.add_document(doc)
-    else:
-        # FineWiki schema: page_id, title, text (content), url
-        for _, row in table.iterrows():
-            doc = tantivy.Document()
-            doc.add_integer("id", int(row.get("page_id", 0)))
-            doc.add_text("title", str(row.get("title", "")))
-            doc.add_text("content", str(row.get("text", "")))
-            doc.add_text("url", str(row.get("url", "")))
-            writer.add_document(doc)
-
-    writer.commit()
+    # Only decode the columns that end up in the index.
+    wanted_columns = PARQUET_COLUMNS.get(dataset, PARQUET_COLUMNS["finewiki"])
+    file_columns = set(reader.schema_arrow.names)
+    columns = [name for name in wanted_columns if name in file_columns]
+
+    # Validate column types once per file so the row loop never coerces:
+    # page ids must decode to ints and every other column to str. Columns
+    # of any other type are cast in Arrow per batch.
+    casts = {}
+    for name in columns:
+        column_type = reader.schema_arrow.field(name).type
+        if name == "page_id":
+            if not pa.types.is_integer(column_type):
+                casts[name] = pa.int64()
+        elif not (
+            pa.types.is_string(column_type) or pa.types.is_large_string(column_type)
+        ):
+            casts[name] = pa.string()
+
+    lock = writer_lock or nullcontext()
+    docs_buffer: list[tantivy.Document] = []
+    # Bound once: Document.from_dict benchmarks slower than add_* calls, so
+    # the per-row cost to trim is the module attribute lookup.
+    Document = tantivy.Document
+
+    # Walk the file as Arrow record batches and decode each column to a
+    # Python list once per batch, instead of materializing a pandas frame
+    # and building a Series per row. to_pylist() already yields str values,
+    # so only nulls need a fallback.
+    for batch in reader.iter_batches(
+        batch_size=BATCH_SIZE, columns=columns, use_threads=True
+    ):
+        if dataset == "fineweb-edu":
+            # FineWeb-Edu schema: text, id, dump, url, date, file_path, language
+            ids, texts, dumps, urls, dates, languages = _batch_columns(
+                batch, wanted_columns, casts
+            )
+            for doc_id, text, dump, url, date, language in zip(
+                ids, texts, dumps, urls, dates, languages
+            ):
+                doc = Document()
+                doc.add_text("id", doc_id or "")
+                doc.add_text("text", text or "")
+                doc.add_text("dump", dump or "")
+                doc.add_text("url", url or "")
+                doc.add_text("date", date or "")
+                doc.add_text("language", language or "")
+                docs_buffer.append(doc)
+        else:
+            # FineWiki schema: page_id, title, text (content), url
+            page_ids, titles, texts, urls = _batch_columns(
+                batch, wanted_columns, casts
+            )
+            for page_id, title, text, url in zip(page_ids, titles, texts, urls):
+                doc = Document()
+                doc.add_integer("id", page_id or 0)
+                doc.add_text("title", title or "")
+                doc.add_text("content", text or "")
+                doc.add_text("url", url or "")
+                docs_buffer.append(doc)
+
+        if len(docs_buffer) >= DOC_BUFFER_SIZE:
+            with lock:
+                _add_documents(writer, docs_buffer)
+            docs_buffer.clear()
+
+    with lock:
+        _add_documents(writer, docs_buffer)
     return num_rows
 
 
+def _index_file_entry(
+    writer: tantivy.IndexWriter,
+    parquet_file: Path,
+    dataset: str,
+    writer_lock: threading.Lock,
+    previous: dict | None,
+) -> dict:
+    """Fingerprint and index one parquet file, returning its metadata entry.
+
+    The file is hashed right before it is decoded, so the hash read leaves
+    the bytes in the page cache for Arrow and hashing overlaps with other
+    files being indexed instead of running as a separate pre-pass.
+
+    Args:
+        writer: Shared tantivy IndexWriter.
+        parquet_file: Parquet file to index.
+        dataset: Dataset name - either 'finewiki' or 'fineweb-edu'.
+        writer_lock: Lock serializing access to the writer.
+        previous: Metadata entry recorded for this file by a previous build,
+            or the fingerprint taken by the up-to-date check.
+
+    Returns:
+        Dictionary with ``hash``, ``mtime_ns``, ``size`` and ``docs`` keys.
+    """
+    fingerprint = file_fingerprint(parquet_file, previous)
+    docs = index_parquet_file(writer, parquet_file, dataset, writer_lock)
+    return {**fingerprint, "docs": docs}
+
+
 def build_index(
     parquet_dir: Path,
     index_dir: Path = Path("index_data"),
     dataset: str = "finewiki",
+    force: bool = False,
+    heap_size: int = WRITER_HEAP_SIZE,
+    num_threads: int = WRITER_NUM_THREADS,
+    countdown: int = 0,
 ) -> tuple[int, int]:
     """Build the full index from parquet files. Returns (total_docs, total_files).
 
+    If an index already exists and every parquet file matches the metadata
+    recorded by the previous build (by mtime and size, or else by content
+    hash), the rebuild is skipped and the recorded document counts are
+    returned.
+
     Args:
         parquet_dir: Directory containing parquet files.
         index_dir: Output directory for index.
         dataset: Dataset name - either 'finewiki' or 'fineweb-edu'.
+        force: Rebuild even if the existing index is up to date.
+        heap_size: Overall tantivy writer heap in bytes. A large heap means
+            fewer, larger segments and less merging; it is clamped to
+            tantivy's per-thread limits.
+        num_threads: Number of tantivy indexing threads.
+        countdown: Seconds to wait before a rebuild starts, giving an operator
+            at a terminal the chance to abort. Defaults to 0 (no wait).
 
     Returns:
         Tuple of (total_documents_indexed, total_files_processed).
 
     Raises:
         FileNotFoundError: If parquet directory does not exist.
+        RuntimeError: If another build is already running on ``index_dir``.
     """
     # Ensure parquet directory exists
     if not parquet_dir.exists():
         raise FileNotFoundError(f"Parquet directory not found: {parquet_dir}")
 
+    # Serialize builds on the same index directory: the backup/rename steps
+    # below are not safe to run concurrently.
+    index_dir.mkdir(parents=True, exist_ok=True)
+    with acquire_lock(index_dir / LOCK_FILE):
+        return _build_index_locked(
+            parquet_dir, index_dir, dataset, force, heap_size, num_threads, countdown
+        )
+
+
+def _build_index_locked(
+    parquet_dir: Path,
+    index_dir: Path,
+    dataset: str,
+    force: bool,
+    heap_size: int,
+    num_threads: int,
+    countdown: int,
+) -> tuple[int, int]:
+    """Body of :func:`build_index`, run while holding the build lock."""
     parquet_files = load_parquet_files(parquet_dir)
 
     if not parquet_files:
@@ -129,57 +467,157 @@ def build_index(
         return 0, 0
 
     index_path = index_dir / ".index"
+    new_index_path = index_dir / ".index_new"
     old_index_path = index_dir / ".index_old"
 
-    # If old index exists from a previous failed run, clean it up
-    if old_index_path.exists():
-        print("Cleaning up leftover old index...")
-        shutil.rmtree(old_index_path)
-
-    # If new index already exists, rename it to .index_old first
-    if index_path.exists():
-        print(f"Backing up existing index to {old_index_path.name}...")
-        index_path.rename(old_index_path)
-        print("Index backed up. Proceeding with full re-index...")
+    # A crash between the two swap renames below leaves only .index_old;
+    # put it back before deciding anything else.
+    if old_index_path.exists() and not index_path.exists():
+        print(f"Restoring {old_index_path.name} left by an interrupted swap...")
+        os.rename(old_index_path, index_path)
+
+    # Compare files against the previous build. Files whose mtime and size
+    # are unchanged are trusted from a stat call; any other file is hashed
+    # and compared with its recorded hash, so a touched or re-downloaded but
+    # identical shard does not force a rebuild.
+    previous = load_metadata(index_dir)
+    previous_files = previous.get("indexed_files", {})
+    # Fingerprints computed by the check, reused by the build below so no
+    # file is hashed twice.
+    checked: dict[str, dict] = {}
+    comparable = (
+        index_path.exists()
+        and previous.get("version") == METADATA_VERSION
+        and previous.get("dataset") == dataset
+        and set(previous_files) == {p.name for p in parquet_files}
+        and index_schema_matches(index_path, dataset)
+    )
+    if comparable and not force:
+        up_to_date = True
+        # Fingerprint concurrently: file_digest releases the GIL, so a
+        # re-download that rewrites every shard is hashed in parallel.
+        executor = ThreadPoolExecutor(max_workers=max(1, min(len(parquet_files), num_threads)))
+        futures = {
+            executor.submit(file_fingerprint, p, previous_files[p.name]): p.name
+            for p in parquet_files
+        }
+        try:
+            for future in as_completed(futures):
+                name = futures[future]
+                checked[name] = future.result()
+                if checked[name]["hash"] != previous_files[name].get("hash"):
+                    # A file changed: stop hashing the rest, they are hashed
+                    # as they are indexed.
+                    up_to_date = False
+                    break
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        # Keep fingerprints of files that finished hashing after the break.
+        for future, name in futures.items():
+            if future.done() and not future.cancelled() and future.exception() is None:
+                checked.setdefault(name, future.result())
+        if up_to_date:
+            # Record the new mtimes and sizes so unchanged content is
+            # trusted from a stat call next time.
+            refreshed = {
+                name: {**entry, **checked[name]} for name, entry in previous_files.items()
+            }
+            if refreshed != previous_files:
+                save_metadata(index_dir, {**previous, "indexed_files": refreshed})
+            # Nothing to index: trust the doc counts recorded by the last
+            # build instead of re-reading every parquet footer.
+            total_docs = sum(entry["docs"] for entry in refreshed.values())
+            print(f"Index at {index_dir} is up to date, nothing to index.")
+            return total_docs, len(parquet_files)
+
+    # Clean up directories left behind by a previous interrupted run
+    for leftover in (old_index_path, new_index_path):
+        if leftover.exists():
+            print(f"Cleaning up leftover {leftover.name}...")
+            shutil.rmtree(leftover)
 
     print("\n=== Starting Full Re-Index ===\n")
     print(f"Dataset: {dataset}")
-    print("This will delete the old index and rebuild from scratch.")
-
-    # 10-second countdown
-    for i in range(10, 0, -1):
-        print(f"Deleting old index and starting in {i} seconds...", end="\r")
-        time.sleep(1)
-    print("\n")
+    print("The new index is built alongside the current one and swapped in when complete.")
+
+    if countdown > 0:
+        for i in range(countdown, 0, -1):
+            print(f"Starting full re-index in {i} seconds...", end="\r")
+            time.sleep(1)
+        print("\n")
+
+    # Build into a sibling directory; the live index stays usable until the
+    # swap below.
+    print(f"Creating new {dataset} index at {new_index_path}...")
+    index = create_index(new_index_path, dataset)
+
+    # One writer shared by all files. Parquet decoding runs in parallel
+    # worker threads (Arrow releases the GIL); tantivy indexes on its own
+    # thread pool and the whole build is committed once at the end.
+    num_threads = max(1, num_threads)
+    heap_size = clamp_writer_heap(heap_size, num_threads)
+    print(f"Writer: {heap_size / 1024**3:.2f} GiB heap, {num_threads} threads")
+    writer = index.writer(heap_size=heap_size, num_threads=num_threads)
+    writer_lock = threading.Lock()
+
+    file_entries: dict[Path, dict] = {}
+    max_workers = min(len(parquet_files), os.cpu_count() or 1)
+    # Largest files first (LPT scheduling): a big shard picked up last would
+    # otherwise leave one worker running long after the others finish.
+    submission_order = sorted(
+        parquet_files, key=lambda p: p.stat().st_size, reverse=True
+    )
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = {
+            executor.submit(
+                _index_file_entry,
+                writer,
+                parquet_file,
+                dataset,
+                writer_lock,
+                checked.get(parquet_file.name) or previous_files.get(parquet_file.name),
+            ): parquet_file
+            for parquet_file in submission_order
+        }
+        print(f"Indexing {len(parquet_files)} files with {max_workers} workers...")
+        for future in as_completed(futures):
+            parquet_file = futures[future]
+            file_entries[parquet_file] = future.result()
+            print(f"  Indexed {file_entries[parquet_file]['docs']} documents from {parquet_file.name}")
+    except BaseException:
+        # Cancel queued files so a failure or Ctrl-C does not wait for the
+        # rest of the corpus to be indexed; files already in progress must
+        # finish before the writer can be rolled back.
+        executor.shutdown(wait=True, cancel_futures=True)
+        # Nothing has been committed yet: drop the partial build so a failed
+        # file never leaves a half-populated index behind.
+        writer.rollback()
+        raise
+    executor.shutdown()
+    total_docs = sum(entry["docs"] for entry in file_entries.values())
+
+    print("Committing index...")
+    writer.commit()
+    # Let tantivy finish merging the freshly flushed segments before the
+    # metadata is written and the process exits.
+    writer.wait_merging_threads()
 
-    # Remove backed up index if it exists (we're doing a full rebuild)
+    # Swap the new index in with directory renames (one syscall each) rather
+    # than moving files one by one; a crash leaves either the old or the new
+    # index in place, never a mix.
+    if index_path.exists():
+        os.rename(index_path, old_index_path)
+    os.rename(new_index_path, index_path)
     if old_index_path.exists():
-        print("Removing backup of old index...")
         shutil.rmtree(old_index_path)
 
-    # Create fresh index
-    print(f"Creating new {dataset} index at {index_dir}...")
-    index = create_index(index_path, dataset)
-
-    total_docs = 0
-    for parquet_file in parquet_files:
-        print(f"Indexing {parquet_file.name}...")
-        docs_in_file = index_parquet_file(index, parquet_file, dataset)
-        total_docs += docs_in_file
-        print(f"  Indexed {docs_in_file} documents")
-
     # Save minimal metadata
-    index_file_hash_map = {}
-    for parquet_file in parquet_files:
-        reader = pq.ParquetFile(parquet_file)
-        num_rows = reader.metadata.num_rows
-        index_file_hash_map[parquet_file.name] = {
-            "docs": num_rows,
-        }
+    index_file_hash_map = {p.name: file_entries[p] for p in parquet_files}
 
     metadata = {
         "indexed_files": index_file_hash_map,
-        "version": 1,
+        "version": METADATA_VERSION,
         "dataset": dataset,
     }
     save_metadata(index_dir, metadata)
@@ -212,6 +650,29 @@ if __name__ == "__main__":
         default="finewiki",
         help="Dataset to index (default: finewiki)",
     )
+    parser.add_argument(
+        "--heap-size-gb",
+        type=float,
+        default=WRITER_HEAP_SIZE / 1024**3,
+        help="Total tantivy writer heap in GiB, split between indexing threads "
+             f"(default: {WRITER_HEAP_SIZE / 1024**3:g})",
+    )
+    parser.add_argument(
+        "--num-threads",
+        type=int,
+        default=WRITER_NUM_THREADS,
+        help=f"Number of tantivy indexing threads (default: {WRITER_NUM_THREADS})",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rebuild the index even if no parquet file changed since the last build",
+    )
+    parser.add_argument(
+        "--yes",
+        action="store_true",
+        help="Start a rebuild immediately, skipping the countdown shown on a terminal",
+    )
 
     args = parser.parse_args()
 
@@ -225,5 +686,11 @@ if __name__ == "__main__":
         Path(parquet_dir),
         Path(index_dir),
         args.dataset,
+        force=args.force,
+        heap_size=int(args.heap_size_gb * 1024**3),
+        num_threads=args.num_threads,
+        # Only pause for a human watching a terminal; headless runs start
+        # straight away.
+        countdown=0 if args.yes or not sys.stdin.isatty() else REBUILD_COUNTDOWN,
     )
     print(f"Indexing complete! Indexed {total_docs} documents across {total_files} files.")
@@ -5,9 +5,38 @@ from pathlib import Path
 import tantivy
 
 try:
-    from finewiki_mcp.common import get_schema
+    from finewiki_mcp.common import TTLCache, get_schema
 except ImportError:
-    from common import get_schema
+    from common import TTLCache, get_schema
+
+
+# Parsed queries only depend on the schema, so they never expire; the cache
+# is just bounded.
+QUERY_CACHE_SIZE = 1024
+# Recently fetched documents, reused for repeated fetches of the same id.
+# Entries hold whole article bodies, so the cache is kept small; search
+# results are cached by the server. After an index rebuild a cached document
+# is served for at most FETCH_CACHE_TTL seconds.
+FETCH_CACHE_SIZE = 64
+FETCH_CACHE_TTL = 60.0
+
+
+def _stored_fields(doc: tantivy.Document, fields: tuple[str, ...]) -> dict:
+    """Read the first value of each named stored field from a document.
+
+    ``Document.to_dict`` converts every stored field, including full article
+    text, into lists and benchmarks slower than a few direct lookups, so only
+    the requested fields are read, with the bound method hoisted.
+
+    Args:
+        doc: Tantivy document retrieved from a searcher.
+        fields: Field names to read.
+
+    Returns:
+        Dictionary mapping each field name to its first value (or None).
+    """
+    get_first = doc.get_first
+    return {name: get_first(name) for name in fields}
 
 
 class FineWikiSearcher:
@@ -24,7 +53,25 @@ class FineWikiSearcher:
             self.index = tantivy.Index.open(self.index_path)
         else:
             self.index = tantivy.Index(get_schema("finewiki"), path=str(self.index_path / '.index'))
-        self.reader = self.index.searcher()
+        self._query_cache = TTLCache(maxsize=QUERY_CACHE_SIZE, ttl=float("inf"))
+        self._fetch_cache = TTLCache(maxsize=FETCH_CACHE_SIZE, ttl=FETCH_CACHE_TTL)
+
+    def _parse_query(self, query: str, field: str) -> tantivy.Query:
+        """Parse a query against a single field, reusing earlier parses.
+
+        Args:
+            query: Raw query string.
+            field: Default field to search.
+
+        Returns:
+            Parsed tantivy query.
+        """
+        key = (field, query)
+        parsed = self._query_cache.get(key)
+        if parsed is None:
+            parsed = self.index.parse_query(query, [field])
+            self._query_cache.set(key, parsed)
+        return parsed
 
     def _get_document_by_id_from_index(self, doc_id: int) -> dict | None:
         """Get document from the index by ID.
@@ -35,21 +82,18 @@ class FineWikiSearcher:
         Returns:
             Dictionary with id, title, content, url or None if not found.
         """
-        # Use parse_query with a numeric range to find document by ID
-        query = self.index.parse_query(f"id:{doc_id}", ["id"])
+        # The id field is an indexed integer, so a term query is a direct
+        # point lookup with no query parsing.
+        query = tantivy.Query.term_query(self.index.schema, "id", doc_id)
 
         searcher = self.index.searcher()
         results = searcher.search(query, limit=1)
 
         if results.hits:
             score, doc_address = results.hits[0]
-            doc = searcher.doc(doc_address)
-            return {
-                "id": doc.get_first("id"),
-                "title": doc.get_first("title"),
-                "content": doc.get_first("content"),
-                "url": doc.get_first("url"),
-            }
+            return _stored_fields(
+                searcher.doc(doc_address), ("id", "title", "content", "url")
+            )
         return None
 
     def search_by_title(
@@ -64,19 +108,17 @@ class FineWikiSearcher:
         Returns:
             List of dictionaries with id, title, and score.
         """
-        parsed_query = self.index.parse_query(query, ["title"])
+        parsed_query = self._parse_query(query, "title")
 
         searcher = self.index.searcher()
         results = searcher.search(parsed_query, limit=limit)
 
         hits = []
+        get_doc = searcher.doc
         for score, doc_address in results.hits:
-            doc = searcher.doc(doc_address)
-            hits.append({
-                "id": doc.get_first("id"),
-                "title": doc.get_first("title"),
-                "score": float(score),
-            })
+            hit = _stored_fields(get_doc(doc_address), ("id", "title"))
+            hit["score"] = score
+            hits.append(hit)
 
         return hits
 
@@ -92,19 +134,17 @@ class FineWikiSearcher:
         Returns:
             List of dictionaries with id, title, and score.
         """
-        parsed_query = self.index.parse_query(query, ["content"])
+        parsed_query = self._parse_query(query, "content")
 
         searcher = self.index.searcher()
         results = searcher.search(parsed_query, limit=limit)
 
         hits = []
+        get_doc = searcher.doc
         for score, doc_address in results.hits:
-            doc = searcher.doc(doc_address)
-            hits.append({
-                "id": doc.get_first("id"),
-                "title": doc.get_first("title"),
-                "score": float(score),
-            })
+            hit = _stored_fields(get_doc(doc_address), ("id", "title"))
+            hit["score"] = score
+            hits.append(hit)
 
         return hits
 
@@ -117,7 +157,13 @@ class FineWikiSearcher:
         Returns:
             Dictionary with id, title, content, url or None if not found.
         """
-        return self._get_document_by_id_from_index(doc_id)
+        doc = self._fetch_cache.get(doc_id)
+        if doc is None:
+            doc = self._get_document_by_id_from_index(doc_id)
+            if doc is None:
+                return None
+            self._fetch_cache.set(doc_id, doc)
+        return dict(doc)
 
 
 class FineWebEduSearcher:
@@ -140,7 +186,25 @@ class FineWebEduSearcher:
     def __init__(self, index_dir: str | Path = "index_data_fineweb_edu"):
         self.index_path = Path(index_dir)
         self.index = tantivy.Index(get_schema("fineweb-edu"), path=str(self.index_path / '.index'))
-        self.reader = self.index.searcher()
+        self._query_cache = TTLCache(maxsize=QUERY_CACHE_SIZE, ttl=float("inf"))
+        self._fetch_cache = TTLCache(maxsize=FETCH_CACHE_SIZE, ttl=FETCH_CACHE_TTL)
+
+    def _parse_query(self, query: str, field: str) -> tantivy.Query:
+        """Parse a query against a single field, reusing earlier parses.
+
+        Args:
+            query: Raw query string.
+            field: Default field to search.
+
+        Returns:
+            Parsed tantivy query.
+        """
+        key = (field, query)
+        parsed = self._query_cache.get(key)
+        if parsed is None:
+            parsed = self.index.parse_query(query, [field])
+            self._query_cache.set(key, parsed)
+        return parsed
 
     def _get_document_by_id_from_index(self, doc_id: str) -> dict | None:
         """Get document from the index by ID.
@@ -151,22 +215,19 @@ class FineWebEduSearcher:
         Returns:
             Dictionary with all document fields or None if not found.
         """
-        query = self.index.parse_query(f"id:\"{doc_id}\"", ["id"])
+        # The id field is indexed untokenized, so a term query on the exact
+        # id is a direct point lookup with no query parsing or escaping.
+        query = tantivy.Query.term_query(self.index.schema, "id", doc_id)
 
         searcher = self.index.searcher()
         results = searcher.search(query, limit=1)
 
         if results.hits:
             score, doc_address = results.hits[0]
-            doc = searcher.doc(doc_address)
-            return {
-                "id": doc.get_first("id"),
-                "text": doc.get_first("text"),
-                "dump": doc.get_first("dump"),
-                "url": doc.get_first("url"),
-                "date": doc.get_first("date"),
-                "language": doc.get_first("language"),
-            }
+            return _stored_fields(
+                searcher.doc(doc_address),
+                ("id", "text", "dump", "url", "date", "language"),
+            )
         return None
 
     def search_by_text(
@@ -181,21 +242,22 @@ class FineWebEduSearcher:
         Returns:
             List of dictionaries with id, text preview, and score.
         """
-        parsed_query = self.index.parse_query(query, ["text"])
+        parsed_query = self._parse_query(query, "text")
 
         searcher = self.index.searcher()
         results = searcher.search(parsed_query, limit=limit)
 
         hits = []
+        get_doc = searcher.doc
         for score, doc_address in results.hits:
-            doc = searcher.doc(doc_address)
-            text = doc.get_first("text") or ""
+            get_first = get_doc(doc_address).get_first
+            text = get_first("text") or ""
             # Provide a preview of the text (first 200 chars)
             text_preview = text[:200] + "..." if len(text) > 200 else text
             hits.append({
-                "id": doc.get_first("id"),
+                "id": get_first("id"),
                 "text_preview": text_preview,
-                "score": float(score),
+                "score": score,
             })
 
         return hits
@@ -209,7 +271,13 @@ class FineWebEduSearcher:
         Returns:
             Dictionary with all document fields or None if not found.
         """
-        return self._get_document_by_id_from_index(doc_id)
+        doc = self._fetch_cache.get(doc_id)
+        if doc is None:
+            doc = self._get_document_by_id_from_index(doc_id)
+            if doc is None:
+                return None
+            self._fetch_cache.set(doc_id, doc)
+        return dict(doc)
 
 
 def aggregate_search(
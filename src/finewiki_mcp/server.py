@@ -1,31 +1,52 @@
 """MCP Server for FineWiki and FineWeb-Edu with Tantivy search capabilities."""
 
-import anyio
+import json
 from pathlib import Path
 
+import anyio
+from mcp.server import InitializationOptions, NotificationOptions, Server
+from mcp.server.stdio import stdio_server
+from mcp.types import TextContent, Tool
+
 try:
-    from finewiki_mcp.searcher import FineWikiSearcher, FineWebEduSearcher
+    from finewiki_mcp.common import TTLCache
+    from finewiki_mcp.searcher import (
+        FineWikiSearcher,
+        FineWebEduSearcher,
+        aggregate_search,
+    )
 except ImportError:
-    from searcher import FineWikiSearcher, FineWebEduSearcher
+    from common import TTLCache
+    from searcher import FineWikiSearcher, FineWebEduSearcher, aggregate_search
 
 
-def create_app():
-    """Create the MCP server application."""
-    from mcp.server import Server
-    from mcp.types import Tool, TextContent
-    from pydantic import BaseModel
+# Recent text_search_knowledge responses, serialized, reused for identical
+# queries.
+SEARCH_CACHE_SIZE = 1024
+SEARCH_CACHE_TTL = 60.0
+
+
+def to_json(value) -> str:
+    """Serialize a tool result as JSON text for a TextContent response.
 
-    class TextSearchKnowledgeRequest(BaseModel):
-        query: str
+    Non-ASCII characters are written as-is rather than escaped, which keeps
+    article text compact and skips the escaping pass.
+    """
+    return json.dumps(value, ensure_ascii=False)
 
-    class FetchKnowledgeRequest(BaseModel):
-        doc_id: str
 
+def create_app():
+    """Create the MCP server application."""
     server = Server("finewiki-search")
 
     finewiki_searcher: FineWikiSearcher | None = None
     fineweb_edu_searcher: FineWebEduSearcher | None = None
 
+    # Rebuilt indexes are picked up by tantivy without reloading the
+    # searchers, so cached results are not invalidated on rebuild; they go
+    # stale for at most SEARCH_CACHE_TTL seconds.
+    search_cache = TTLCache(maxsize=SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TTL)
+
     # Define tools with comprehensive documentation for LLM usage
     @server.list_tools()
     async def list_tools() -> list[Tool]:
@@ -83,6 +104,9 @@ Examples:
     @server.call_tool()
     async def call_tool(name: str, arguments: dict) -> list[TextContent]:
         nonlocal finewiki_searcher, fineweb_edu_searcher
+        # The MCP server validates arguments against each tool's inputSchema
+        # before dispatching here, so required string fields can be read
+        # directly without building a model per call.
 
         # Aggregated knowledge tools
         if name == "text_search_knowledge":
@@ -93,24 +117,31 @@ Examples:
                         text="FineWeb-Edu index not available. Please build the index first with: ./run_finewiki.sh index --dataset fineweb-edu",
                     )
                 ]
-            req = TextSearchKnowledgeRequest(**arguments)
-            from finewiki_mcp.searcher import aggregate_search
-
-            results = aggregate_search(
-                finewiki_searcher, fineweb_edu_searcher, req.query, total_limit=20
-            )
-            return [TextContent(type="text", text=str(results))]
+            query = arguments["query"]
+
+            cache_key = (query, 20)
+            text = search_cache.get(cache_key)
+            if text is None:
+                # Searches are blocking tantivy calls; run them on a worker
+                # thread so concurrent requests keep being served.
+                results = await anyio.to_thread.run_sync(
+                    aggregate_search, finewiki_searcher, fineweb_edu_searcher, query, 20
+                )
+                text = to_json(results)
+                search_cache.set(cache_key, text)
+            return [TextContent(type="text", text=text)]
 
         elif name == "fetch_knowledge":
-            req = FetchKnowledgeRequest(**arguments)
-            doc_id = req.doc_id
+            doc_id = arguments["doc_id"]
 
             # Parse prefix and fetch from appropriate source
             if doc_id.startswith("wiki:"):
                 wiki_id = int(doc_id[5:])  # Remove 'wiki:' prefix
-                content = finewiki_searcher.fetch_content(wiki_id)
+                content = await anyio.to_thread.run_sync(
+                    finewiki_searcher.fetch_content, wiki_id
+                )
                 if content:
-                    return [TextContent(type="text", text=str(content))]
+                    return [TextContent(type="text", text=to_json(content))]
                 return [
                     TextContent(
                         type="text", text=f"Wikipedia document not found: {doc_id}"
@@ -126,9 +157,11 @@ Examples:
                             text="FineWeb-Edu index not available. Please build the index first with: ./run_finewiki.sh index --dataset fineweb-edu",
                         )
                     ]
-                content = fineweb_edu_searcher.fetch_content(edu_id)
+                content = await anyio.to_thread.run_sync(
+                    fineweb_edu_searcher.fetch_content, edu_id
+                )
                 if content:
-                    return [TextContent(type="text", text=str(content))]
+                    return [TextContent(type="text", text=to_json(content))]
                 return [
                     TextContent(
                         type="text", text=f"Educational document not found: {doc_id}"
@@ -176,7 +209,12 @@ if __name__ == "__main__":
     args = parser.parse_args()
 
     if args.mode == "test":
-        from finewiki_mcp.tester import run_test
+        # Runs the queries in this process against the loaded indexes; no
+        # server or client subprocess is involved.
+        try:
+            from finewiki_mcp.tester import run_test
+        except ImportError:
+            from tester import run_test
 
         run_test(args.index_dir)
     else:
@@ -184,9 +222,6 @@ if __name__ == "__main__":
         init_searchers(args.index_dir)
 
         async def main():
-            from mcp.server.stdio import stdio_server
-            from mcp.server import InitializationOptions, NotificationOptions
-
             async with stdio_server() as (read_stream, write_stream):
                 await server.run(
                     read_stream,
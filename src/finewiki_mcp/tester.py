@@ -37,9 +37,9 @@ def run_test(index_dir: str) -> None:
     print(f"Test Mode - Testing aggregated knowledge tools")
     print(f"FineWiki index: {index_dir}")
 
-    start_time = time.time()
+    start_time = time.perf_counter()
     finewiki_searcher = FineWikiSearcher(index_dir=index_dir)
-    load_time = time.time() - start_time
+    load_time = time.perf_counter() - start_time
     mem_after_wiki_load = get_memory_usage()
     print(f"  FineWiki index loaded in {load_time:.3f}s")
     print(f"  Memory after loading: {mem_after_wiki_load:.2f} GB")
@@ -70,13 +70,13 @@ def run_test(index_dir: str) -> None:
         print(f"\n--- Query: '{query}' ---")
 
         # Test aggregate_search (used by text_search_knowledge tool)
-        start_time = time.time()
+        start_time = time.perf_counter()
         results = aggregate_search(
             finewiki_searcher, fineweb_edu_searcher, query, total_limit=20
         )
-        search_time = time.time() - start_time
+        search_time = time.perf_counter() - start_time
 
-        print(f"  Search completed in {search_time:.3f}s")
+        print(f"  Search completed in {search_time * 1e3:.2f}ms")
 
         # Count wiki vs edu results
         wiki_count = sum(1 for r in results if r["id"].startswith("wiki:"))
@@ -114,7 +114,7 @@ def run_test(index_dir: str) -> None:
 
         for source_type, result in fetch_targets:
             doc_id = result["id"]
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             # Simulate the fetch_knowledge tool logic
             if doc_id.startswith("wiki:"):
@@ -126,12 +126,12 @@ def run_test(index_dir: str) -> None:
                 content = fineweb_edu_searcher.fetch_content(edu_id)
                 source_name = "Educational"
 
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
             fetch_times.append(elapsed)
             all_fetch_times.append(elapsed)
 
             if content:
-                print(f"\n  [{source_name}] Fetch completed in {elapsed:.3f}s")
+                print(f"\n  [{source_name}] Fetch completed in {elapsed * 1e3:.2f}ms")
                 print(f"    ID: {doc_id}")
 
                 if source_type == "wiki":
@@ -149,9 +149,9 @@ def run_test(index_dir: str) -> None:
                 print(f"\n  [{source_name}] Document not found: {doc_id}")
 
         total_fetch_time = sum(fetch_times)
-        print(f"\n  Total fetch time for this query: {total_fetch_time:.3f}s")
+        print(f"\n  Total fetch time for this query: {total_fetch_time * 1e3:.2f}ms")
         print(
-            f"  Average per document: {(total_fetch_time / len(fetch_times)) * 1000:.1f}ms"
+            f"  Average per document: {(total_fetch_time / len(fetch_times)) * 1e3:.2f}ms"
         )
 
     # Summary statistics
@@ -164,6 +164,6 @@ def run_test(index_dir: str) -> None:
     print(f"Total fetches performed: {len(all_fetch_times)}")
     if all_fetch_times:
         avg_fetch = (sum(all_fetch_times) / len(all_fetch_times)) * 1000
-        print(f"Average fetch time: {avg_fetch:.1f}ms")
+        print(f"Average fetch time: {avg_fetch:.2f}ms")
     print(f"Final memory usage: {mem_final:.2f} GB")
     print("\n✓ All tests completed successfully!")